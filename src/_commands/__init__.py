@@ -0,0 +1 @@
+"""Subcommand implementations, imported on demand by ``src.cli.LazyGroup``."""
@@ -0,0 +1,160 @@
+"""Shared helpers for the lazily loaded CLI subcommands."""
+
+import logging
+import os
+import sys
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Tuple
+import click
+
+# Heavy modules (task_manager, dateutil, colorama) and logging handlers are set up
+# on first use so that `--help` and argument errors exit without touching them.
+LOG_DIR = "logs"
+LOG_FILE = "task_manager.log"
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# colorama Fore attribute names, keyed by TaskPriority / TaskStatus values
+PRIORITY_COLORS = {"low": "GREEN", "medium": "YELLOW", "high": "MAGENTA", "critical": "RED"}
+STATUS_COLORS = {
+    "todo": "CYAN",
+    "in_progress": "YELLOW",
+    "completed": "GREEN",
+    "cancelled": "RED",
+}
+
+logger = logging.getLogger(__name__)
+
+
+def load_core() -> ModuleType:
+    """Import and return the task_manager module (TaskManager, TaskPriority, TaskStatus)."""
+    from src import task_manager  # pylint: disable=import-outside-toplevel
+
+    return task_manager
+
+
+def open_manager() -> Any:
+    """Return the TaskManager for the current command.
+
+    Inside ``batch`` this is the manager shared by every line of the script;
+    otherwise a new one is created using the options given to the root command.
+    """
+    options = click.get_current_context().find_object(dict) or {}
+    manager = options.get("manager")
+    if manager is None:
+        manager = load_core().TaskManager(pretty=options.get("pretty", False))
+    return manager
+
+
+class _NoColor:
+    """Stand-in for colorama's Fore/Style whose attributes are all empty strings."""
+
+    def __getattr__(self, name: str) -> str:
+        return ""
+
+
+@lru_cache(maxsize=None)
+def load_colors() -> Tuple[Any, Any]:
+    """Return (Fore, Style) for the current stdout.
+
+    When stdout is not a terminal no escape codes are written and colorama is
+    not imported at all. colorama's stream wrapping is only installed on
+    Windows, where the terminal needs it to translate the codes.
+    """
+    if not sys.stdout.isatty():
+        return _NoColor(), _NoColor()
+
+    # pylint: disable=import-outside-toplevel
+    from colorama import Fore, Style
+
+    if os.name == "nt":
+        from colorama import init
+
+        # Initialize colorama for Windows support
+        init(autoreset=True)
+    return Fore, Style
+
+
+@lru_cache(maxsize=None)
+def configure_logging() -> None:
+    """Configure the root logger; runs once, from the first command invoked.
+
+    File writes go through a QueueListener thread so logging on the command
+    path is a queue put. The console handler stays synchronous to keep log
+    lines in order with the command's own output. The level is INFO unless
+    the root --verbose flag was given.
+    """
+    # pylint: disable=import-outside-toplevel
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+    from pathlib import Path
+
+    ctx = click.get_current_context(silent=True)
+    options = (ctx.find_object(dict) if ctx else None) or {}
+    level = logging.DEBUG if options.get("verbose") else logging.INFO
+
+    log_dir = Path(LOG_DIR)
+    log_dir.mkdir(exist_ok=True)
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = logging.FileHandler(log_dir / LOG_FILE, encoding="utf-8")
+    file_handler.setFormatter(formatter)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+
+    # Configure root logger. basicConfig is not used because it would give the
+    # QueueHandler a formatter and the file handler would format records twice.
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+    root.addHandler(console_handler)
+
+    # Set third-party loggers to WARNING to reduce noise
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    logging.getLogger("requests").setLevel(logging.WARNING)
+
+    logger.info("Task Manager CLI started")
+
+
+def print_success(message: str) -> None:
+    """Print success message in green."""
+    fore, style = load_colors()
+    click.echo(f"{fore.GREEN}✓ {message}{style.RESET_ALL}")
+
+
+def print_error(message: str) -> None:
+    """Print error message in red."""
+    fore, style = load_colors()
+    click.echo(f"{fore.RED}✗ {message}{style.RESET_ALL}")
+
+
+def print_warning(message: str) -> None:
+    """Print warning message in yellow."""
+    fore, style = load_colors()
+    click.echo(f"{fore.YELLOW}⚠ {message}{style.RESET_ALL}")
+
+
+def print_info(message: str) -> None:
+    """Print info message in blue."""
+    fore, style = load_colors()
+    click.echo(f"{fore.BLUE}ℹ {message}{style.RESET_ALL}")
+
+
+@lru_cache(maxsize=None)
+def get_priority_color(priority: str) -> str:
+    """Get color for priority level (resolved once per priority)."""
+    fore, _ = load_colors()
+    return getattr(fore, PRIORITY_COLORS.get(priority, "WHITE"))  # type: ignore[no-any-return]
+
+
+@lru_cache(maxsize=None)
+def get_status_color(status: str) -> str:
+    """Get color for status (resolved once per status)."""
+    fore, _ = load_colors()
+    return getattr(fore, STATUS_COLORS.get(status, "WHITE"))  # type: ignore[no-any-return]
@@ -0,0 +1,45 @@
+"""The ``add`` subcommand: create a new task."""
+
+import logging
+import sys
+from typing import Optional
+import click
+from src._commands._common import configure_logging, open_manager, print_error, print_success
+
+logger = logging.getLogger(__name__)
+
+
+@click.command(name="add")
+@click.argument("title")
+@click.option("--description", "-d", default="", help="Task description")
+@click.option(
+    "--priority",
+    "-p",
+    type=click.Choice(["low", "medium", "high", "critical"]),
+    default="medium",
+    help="Task priority",
+)
+@click.option("--due-date", help="Due date (ISO format: YYYY-MM-DD)")
+def add(title: str, description: str, priority: str, due_date: Optional[str]) -> None:
+    """Add a new task."""
+    configure_logging()
+    logger.info("Adding new task: title='%s', priority=%s", title, priority)
+
+    try:
+        manager = open_manager()
+        task = manager.add_task(
+            title=title, description=description, priority=priority, due_date=due_date
+        )
+        print_success(f"Task added with ID: {task.task_id}")
+        logger.info("Task successfully added: id=%d", task.task_id)
+    except ValueError as e:
+        print_error(f"Invalid input: {e}")
+        logger.error("Failed to add task: %s", e)
+        sys.exit(1)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        print_error(f"Failed to add task: {e}")
+        logger.critical("Unexpected error adding task: %s", e, exc_info=True)
+        sys.exit(1)
+
+
+cmd = add
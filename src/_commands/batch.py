@@ -0,0 +1,96 @@
+"""The ``batch`` subcommand: apply many commands with a single load and save."""
+
+import logging
+import shlex
+import sys
+from typing import TextIO
+import click
+from src._commands._common import (
+    configure_logging,
+    load_core,
+    print_error,
+    print_success,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _run_line(ctx: click.Context, line: str) -> None:
+    """Parse one script line and invoke the matching subcommand under ctx."""
+    args = shlex.split(line)
+    name = args[0]
+    root = ctx.find_root().command
+    command = None
+    if name != "batch" and isinstance(root, click.Group):
+        command = root.get_command(ctx, name)
+    if command is None:
+        raise click.UsageError(f"Unknown command '{name}'")
+
+    with command.make_context(name, args[1:], parent=ctx) as sub_ctx:
+        command.invoke(sub_ctx)
+
+
+def _apply_line(ctx: click.Context, line_no: int, line: str) -> bool:
+    """Run one script line, reporting errors; return whether it succeeded."""
+    try:
+        _run_line(ctx, line)
+    except (ValueError, click.ClickException, click.Abort) as e:
+        # click.Abort has no message
+        message = str(e) or "aborted"
+        print_error(f"Line {line_no}: {message}")
+        logger.error("Batch line %d failed: %s", line_no, message)
+        return False
+    except SystemExit as e:
+        # Subcommands report their own errors before calling sys.exit(1)
+        return not e.code
+    except click.exceptions.Exit as e:
+        # Raised by --help and ctx.exit(); not a SystemExit in click 8.1
+        return not e.exit_code
+    return True
+
+
+@click.command(name="batch")
+@click.argument("script", type=click.File("r", encoding="utf-8"))
+@click.pass_context
+def batch(ctx: click.Context, script: TextIO) -> None:
+    """Run the commands listed in SCRIPT, one per line ('-' reads stdin).
+
+    Each line is a regular command such as `add "Write report" -p high` or
+    `complete 3`; blank lines and lines starting with '#' are skipped. The task
+    file is read once and written once at the end. Use `delete ID --yes` to
+    skip the confirmation prompt.
+    """
+    configure_logging()
+    logger.info("Running batch script: %s", script.name)
+
+    options = ctx.ensure_object(dict)
+    try:
+        manager = load_core().TaskManager(autosave=False, pretty=options.get("pretty", False))
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        print_error(f"Failed to load tasks: {e}")
+        logger.error("Error loading tasks for batch: %s", e)
+        sys.exit(1)
+    options["manager"] = manager
+
+    applied = failed = 0
+    try:
+        for line_no, line in enumerate(script, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            if _apply_line(ctx, line_no, line):
+                applied += 1
+            else:
+                failed += 1
+    finally:
+        manager.flush()
+
+    logger.info("Batch finished: %d applied, %d failed", applied, failed)
+    if failed:
+        print_error(f"Batch finished: {applied} applied, {failed} failed.")
+        sys.exit(1)
+    print_success(f"Batch finished: {applied} applied.")
+
+
+cmd = batch
@@ -0,0 +1,39 @@
+"""The ``complete`` subcommand: mark a task as completed."""
+
+import logging
+import sys
+import click
+from src._commands._common import (
+    configure_logging,
+    load_core,
+    open_manager,
+    print_error,
+    print_success,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@click.command(name="complete")
+@click.argument("task_id", type=int)
+def complete(task_id: int) -> None:
+    """Mark a task as completed."""
+    configure_logging()
+    logger.info("Marking task as completed: id=%d", task_id)
+
+    try:
+        manager = open_manager()
+        success = manager.update_task(task_id=task_id, status=load_core().TaskStatus.COMPLETED)
+
+        if success:
+            print_success(f"Task {task_id} marked as completed! 🎉")
+        else:
+            print_error(f"Task {task_id} not found.")
+
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        print_error(f"Failed to complete task: {e}")
+        logger.error("Error completing task %d: %s", task_id, e)
+        sys.exit(1)
+
+
+cmd = complete
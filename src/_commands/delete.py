@@ -0,0 +1,34 @@
+"""The ``delete`` subcommand: remove a task."""
+
+import logging
+import sys
+import click
+from src._commands._common import configure_logging, open_manager, print_error, print_success
+
+logger = logging.getLogger(__name__)
+
+
+@click.command(name="delete")
+@click.argument("task_id", type=int)
+@click.confirmation_option(prompt="Are you sure you want to delete this task?")
+def delete(task_id: int) -> None:
+    """Delete a task."""
+    configure_logging()
+    logger.info("Deleting task: id=%d", task_id)
+
+    try:
+        manager = open_manager()
+        success = manager.delete_task(task_id)
+
+        if success:
+            print_success(f"Task {task_id} deleted successfully.")
+        else:
+            print_error(f"Task {task_id} not found.")
+
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        print_error(f"Failed to delete task: {e}")
+        logger.error("Error deleting task %d: %s", task_id, e)
+        sys.exit(1)
+
+
+cmd = delete
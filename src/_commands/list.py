@@ -0,0 +1,93 @@
+"""The ``list`` subcommand: list tasks with optional filters."""
+
+import logging
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+import click
+from src._commands._common import (
+    configure_logging,
+    get_priority_color,
+    get_status_color,
+    load_colors,
+    open_manager,
+    print_error,
+    print_info,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _row_format(priority: str, status: str) -> str:
+    """Build the row template for a (priority, status) pair.
+
+    The priority and status colors are switched back to back and reset once,
+    instead of resetting after every colored field.
+    """
+    _, style = load_colors()
+    return (
+        "{task_id:<5} {title:<30} "
+        f"{get_priority_color(priority)}{{priority:<10}} "
+        f"{get_status_color(status)}{{status:<15}}{style.RESET_ALL} "
+        "{due:<12}{overdue}"
+    )
+
+
+@click.command(name="list")
+@click.option("--status", "-s", help="Filter by status")
+@click.option("--priority", "-p", help="Filter by priority")
+@click.option("--overdue", is_flag=True, help="Show only overdue tasks")
+def list_tasks(status: Optional[str], priority: Optional[str], overdue: bool) -> None:
+    """List all tasks."""
+    configure_logging()
+    logger.info("Listing tasks: status=%s, priority=%s, overdue=%s", status, priority, overdue)
+
+    try:
+        manager = open_manager()
+
+        if overdue:
+            tasks = manager.get_overdue_tasks()
+            if not tasks:
+                print_info("No overdue tasks!")
+                return
+        else:
+            tasks = manager.list_tasks(status=status, priority=priority)
+
+        if not tasks:
+            print_info("No tasks found.")
+            logger.info("No tasks matched the criteria")
+            return
+
+        fore, style = load_colors()
+        overdue_marker = f"{fore.RED} [OVERDUE]{style.RESET_ALL}"
+        now = datetime.now()
+        lines = [
+            f"\n{fore.CYAN}{'ID':<5} {'Title':<30} {'Priority':<10} "
+            f"{'Status':<15} {'Due Date':<12}{style.RESET_ALL}",
+            "=" * 80,
+        ]
+        lines.extend(
+            _row_format(task.priority, task.status).format(
+                task_id=task.task_id,
+                title=task.title,
+                priority=task.priority,
+                status=task.status,
+                due=task.due_date[:10] if task.due_date else "N/A",
+                overdue=overdue_marker if task.is_overdue_at(now) else "",
+            )
+            for task in tasks
+        )
+        # One write for the whole table instead of one echo per row
+        click.echo("\n".join(lines))
+
+        logger.info("Listed %d tasks", len(tasks))
+
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        print_error(f"Failed to list tasks: {e}")
+        logger.critical("Error listing tasks: %s", e, exc_info=True)
+        sys.exit(1)
+
+
+cmd = list_tasks
@@ -0,0 +1,59 @@
+"""The ``show`` subcommand: display a single task."""
+
+import logging
+import sys
+import click
+from src._commands._common import (
+    configure_logging,
+    get_priority_color,
+    get_status_color,
+    load_colors,
+    open_manager,
+    print_error,
+    print_warning,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@click.command(name="show")
+@click.argument("task_id", type=int)
+def show(task_id: int) -> None:
+    """Show detailed information about a task."""
+    configure_logging()
+    logger.debug("Showing details for task: id=%d", task_id)
+
+    try:
+        manager = open_manager()
+        task = manager.get_task(task_id)
+
+        if not task:
+            print_error(f"Task {task_id} not found.")
+            return
+
+        fore, style = load_colors()
+        click.echo(f"\n{fore.CYAN}Task Details:{style.RESET_ALL}")
+        click.echo(f"ID:          {task.task_id}")
+        click.echo(f"Title:       {task.title}")
+        click.echo(f"Description: {task.description or 'N/A'}")
+        click.echo(
+            f"Priority:    {get_priority_color(task.priority)}{task.priority}{style.RESET_ALL}"
+        )
+        click.echo(f"Status:      {get_status_color(task.status)}{task.status}{style.RESET_ALL}")
+        click.echo(f"Due Date:    {task.due_date or 'N/A'}")
+        click.echo(f"Created:     {task.created_at}")
+        click.echo(f"Updated:     {task.updated_at}")
+
+        if task.is_overdue():
+            print_warning("This task is OVERDUE!")
+            logger.warning(
+                "Task %s ('%s') is overdue! Due: %s", task.task_id, task.title, task.due_date
+            )
+
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        print_error(f"Failed to show task: {e}")
+        logger.error("Error showing task %d: %s", task_id, e)
+        sys.exit(1)
+
+
+cmd = show
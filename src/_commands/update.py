@@ -0,0 +1,53 @@
+"""The ``update`` subcommand: change fields of an existing task."""
+
+import logging
+import sys
+from typing import Optional
+import click
+from src._commands._common import configure_logging, open_manager, print_error, print_success
+
+logger = logging.getLogger(__name__)
+
+
+@click.command(name="update")
+@click.argument("task_id", type=int)
+@click.option("--status", "-s", help="New status")
+@click.option("--priority", "-p", help="New priority")
+@click.option("--title", "-t", help="New title")
+@click.option("--description", "-d", help="New description")
+@click.option("--due-date", help="New due date")
+def update(  # pylint: disable=too-many-arguments
+    task_id: int,
+    status: Optional[str],
+    priority: Optional[str],
+    title: Optional[str],
+    description: Optional[str],
+    due_date: Optional[str],
+) -> None:
+    """Update an existing task."""
+    configure_logging()
+    logger.info("Updating task: id=%d", task_id)
+
+    try:
+        manager = open_manager()
+        success = manager.update_task(
+            task_id=task_id,
+            title=title,
+            description=description,
+            priority=priority,
+            status=status,
+            due_date=due_date,
+        )
+
+        if success:
+            print_success(f"Task {task_id} updated successfully.")
+        else:
+            print_error(f"Task {task_id} not found.")
+
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        print_error(f"Failed to update task: {e}")
+        logger.error("Error updating task %d: %s", task_id, e)
+        sys.exit(1)
+
+
+cmd = update
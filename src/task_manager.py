@@ -1,16 +1,91 @@
 """Task Manager - Core business logic for managing tasks."""
 
+import atexit
 import logging
 import json
+import os
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime
 from dateutil import parser as date_parser
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional accelerator
+    ijson = None
+
+# Storage files at least this large are streamed with ijson (when installed)
+# instead of being parsed in one go
+STREAM_MIN_BYTES = 32 * 1024 * 1024
+
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
 
+def _dumps(data: Dict, pretty: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON, compact unless pretty is requested."""
+    if orjson is not None:
+        # orjson is a C extension, so pylint cannot see its members
+        # pylint: disable-next=no-member
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Dict:
+    """Parse UTF-8 JSON; orjson errors subclass json.JSONDecodeError."""
+    if orjson is not None:
+        # pylint: disable-next=no-member
+        return orjson.loads(raw)  # type: ignore[no-any-return]
+    return json.loads(raw)
+
+
+def _read_storage(f: BinaryIO) -> Tuple[Iterable[Dict], Dict]:
+    """Return (task records, header fields such as next_id) from an open storage file.
+
+    Files of at least STREAM_MIN_BYTES are streamed with ijson when it is
+    installed, so the whole document is never held in memory. For smaller
+    files a full parse (orjson or json) is faster. When streaming, the header
+    is only complete once the records have been consumed.
+    """
+    if ijson is None or os.fstat(f.fileno()).st_size < STREAM_MIN_BYTES:
+        data = _loads(f.read())
+        return data["tasks"], data
+
+    header: Dict = {}
+    return _stream_storage(f, header), header
+
+
+def _stream_storage(f: BinaryIO, header: Dict) -> Iterator[Dict]:
+    """Yield task records with ijson, storing top-level scalars into header.
+
+    One pass over the events handles both layouts: next_id before the task
+    list (as written now) or after it (older files). Raises
+    json.JSONDecodeError on bad input.
+    """
+    builder = None
+    try:
+        for prefix, event, value in ijson.parse(f):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "tasks.item" and event == "end_map":
+                    yield builder.value
+                    builder = None
+            elif prefix == "tasks.item" and event == "start_map":
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == "next_id" and event == "number":
+                header["next_id"] = value
+    except ijson.JSONError as e:
+        raise json.JSONDecodeError(str(e), "", 0) from e
+
+
 class TaskPriority:
     """Task priority levels."""
 
@@ -32,6 +107,18 @@ class TaskStatus:
 class Task:
     """Represents a single task with metadata."""
 
+    __slots__ = (
+        "title",
+        "description",
+        "priority",
+        "status",
+        "_due_date",
+        "_due_dt",
+        "task_id",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(
         self,
         title: str,
@@ -64,12 +151,13 @@ class Task:
         self.created_at = datetime.now().isoformat()
         self.updated_at = self.created_at
 
-        logger.debug(
-            "Task created: id=%s, title='%s', priority=%s",
-            self.task_id,
-            self.title,
-            self.priority,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Task created: id=%s, title='%s', priority=%s",
+                self.task_id,
+                self.title,
+                self.priority,
+            )
 
     def to_dict(self) -> Dict:
         """Convert task to dictionary representation."""
@@ -86,40 +174,78 @@ class Task:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "Task":
-        """Create a task from dictionary representation."""
-        task = cls(
-            title=data["title"],
-            description=data.get("description", ""),
-            priority=data.get("priority", TaskPriority.MEDIUM),
-            status=data.get("status", TaskStatus.TODO),
-            due_date=data.get("due_date"),
-            task_id=data.get("task_id"),
-        )
-        task.created_at = data.get("created_at", task.created_at)
-        task.updated_at = data.get("updated_at", task.updated_at)
+        """Create a task from dictionary representation.
+
+        Stored data is trusted, so __init__ (validation, stripping, timestamps,
+        debug logging) is skipped and the slots are filled directly.
+        """
+        task = cls.__new__(cls)
+        task.title = data["title"]
+        task.description = data.get("description", "")
+        task.priority = data.get("priority", TaskPriority.MEDIUM)
+        task.status = data.get("status", TaskStatus.TODO)
+        task.due_date = data.get("due_date")
+        task.task_id = data.get("task_id")
+        task.created_at = data.get("created_at") or datetime.now().isoformat()
+        task.updated_at = data.get("updated_at") or task.created_at
         return task
 
+    @property
+    def due_date(self) -> Optional[str]:
+        """Due date string as given (ISO or anything dateutil can parse), or None."""
+        return self._due_date
+
+    @due_date.setter
+    def due_date(self, value: Optional[str]) -> None:
+        """Set the due date and drop the cached parse of the old one."""
+        self._due_date = value
+        self._due_dt: Optional[datetime] = None
+
+    def _parse_due(self) -> Optional[datetime]:
+        """Return the parsed due date, caching it after the first parse.
+
+        ISO strings go through datetime.fromisoformat; anything else falls back
+        to dateutil. Raises ValueError if the due date cannot be parsed.
+        """
+        if self._due_dt is None and self._due_date:
+            try:
+                self._due_dt = datetime.fromisoformat(self._due_date)
+            except ValueError:
+                self._due_dt = date_parser.parse(self._due_date)
+        return self._due_dt
+
     def is_overdue(self) -> bool:
         """Check if task is overdue.
 
         Returns:
             True if task has a due date and it's in the past, False otherwise
         """
-        if not self.due_date:
-            logger.debug("Task %s has no due date", self.task_id)
+        return self.is_overdue_at(datetime.now())
+
+    def is_overdue_at(self, now: datetime) -> bool:
+        """Check if task is overdue at a given time.
+
+        Callers checking many tasks read the clock once and pass it in.
+
+        Args:
+            now: The time to check against
+
+        Returns:
+            True if task has a due date before now, False otherwise
+        """
+        if not self._due_date:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Task %s has no due date", self.task_id)
+            return False
+
+        if self.status == TaskStatus.COMPLETED:
             return False
 
         try:
-            due = date_parser.parse(self.due_date)
-            is_overdue = due < datetime.now() and self.status != TaskStatus.COMPLETED
-            if is_overdue:
-                logger.warning(
-                    "Task %s ('%s') is overdue! Due: %s",
-                    self.task_id,
-                    self.title,
-                    self.due_date,
-                )
-            return is_overdue
+            # The parse is cached per task; plain YYYY-MM-DD dates parse to
+            # midnight, so a task is overdue from the start of its due day
+            due = self._parse_due()
+            return due is not None and due < now
         except (ValueError, TypeError) as e:
             logger.error("Invalid due date format for task %s: %s", self.task_id, e)
             return False
@@ -128,18 +254,34 @@ class Task:
 class TaskManager:
     """Manages a collection of tasks with persistence."""
 
-    def __init__(self, storage_path: str = "tasks.json"):
+    def __init__(
+        self, storage_path: str = "tasks.json", autosave: bool = True, pretty: bool = False
+    ):
         """Initialize the task manager.
 
         Args:
             storage_path: Path to JSON file for task persistence
+            autosave: Write the file after every mutation. When False, changes
+                are buffered until flush() is called (or the interpreter exits).
+            pretty: Write the file indented instead of compact (for debugging)
         """
         self.storage_path = Path(storage_path)
-        self.tasks: List[Task] = []
+        self.autosave = autosave
+        self.pretty = pretty
+        self._dirty = False
+        # Tasks keyed by id; dicts keep insertion order, so this is also the list order
+        self._by_id: Dict[int, Task] = {}
         self.next_id = 1
 
         logger.info("TaskManager initialized with storage: %s", self.storage_path)
         self._load_tasks()
+        if not autosave:
+            atexit.register(self.flush)
+
+    @property
+    def tasks(self) -> List[Task]:
+        """All tasks in insertion order, as a new list."""
+        return list(self._by_id.values())
 
     def _load_tasks(self) -> None:
         """Load tasks from storage file."""
@@ -148,11 +290,18 @@ class TaskManager:
             return
 
         try:
-            with open(self.storage_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.tasks = [Task.from_dict(task_data) for task_data in data["tasks"]]
-                self.next_id = data.get("next_id", 1)
-                logger.info("Loaded %d tasks from storage", len(self.tasks))
+            with open(self.storage_path, "rb") as f:
+                records, header = _read_storage(f)
+                unindexed = []
+                for task_data in records:
+                    task = Task.from_dict(task_data)
+                    if task.task_id is None or task.task_id in self._by_id:
+                        unindexed.append(task)
+                    else:
+                        self._by_id[task.task_id] = task
+            self.next_id = max(header.get("next_id", 1), max(self._by_id, default=0) + 1)
+            self._assign_fresh_ids(unindexed)
+            logger.info("Loaded %d tasks from storage", len(self._by_id))
         except json.JSONDecodeError as e:
             logger.error("Failed to parse JSON from %s: %s", self.storage_path, e)
             raise
@@ -160,20 +309,51 @@ class TaskManager:
             logger.critical("Unexpected error loading tasks from %s: %s", self.storage_path, e)
             raise
 
+    def _assign_fresh_ids(self, tasks: List[Task]) -> None:
+        """Give loaded tasks with a missing or duplicate id the next free id.
+
+        They are added after the correctly indexed tasks, so no stored task is
+        overwritten (and then dropped from the file by the next save).
+        """
+        for task in tasks:
+            logger.warning(
+                "Task '%s' has a missing or duplicate id %s; assigning id %d",
+                task.title,
+                task.task_id,
+                self.next_id,
+            )
+            task.task_id = self.next_id
+            self._by_id[self.next_id] = task
+            self.next_id += 1
+
     def _save_tasks(self) -> None:
         """Save tasks to storage file."""
         try:
             data = {
-                "tasks": [task.to_dict() for task in self.tasks],
                 "next_id": self.next_id,
+                "tasks": [task.to_dict() for task in self._by_id.values()],
             }
-            with open(self.storage_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            logger.debug("Saved %d tasks to storage", len(self.tasks))
+            with open(self.storage_path, "wb") as f:
+                f.write(_dumps(data, pretty=self.pretty))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Saved %d tasks to storage", len(self._by_id))
         except IOError as e:
             logger.critical("Failed to write to %s: %s", self.storage_path, e)
             raise
 
+    def _persist(self) -> None:
+        """Save now, or mark the manager dirty when autosave is disabled."""
+        if self.autosave:
+            self._save_tasks()
+        else:
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write buffered changes to storage, if there are any."""
+        if self._dirty:
+            self._save_tasks()
+            self._dirty = False
+
     def add_task(
         self,
         title: str,
@@ -199,9 +379,9 @@ class TaskManager:
             due_date=due_date,
             task_id=self.next_id,
         )
-        self.tasks.append(task)
+        self._by_id[self.next_id] = task
         self.next_id += 1
-        self._save_tasks()
+        self._persist()
 
         logger.info("Task added: id=%d, title='%s'", task.task_id, task.title)
         return task
@@ -215,10 +395,11 @@ class TaskManager:
         Returns:
             The task if found, None otherwise
         """
-        for task in self.tasks:
-            if task.task_id == task_id:
+        task = self._by_id.get(task_id)
+        if task is not None:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("Task found: id=%d", task_id)
-                return task
+            return task
 
         logger.warning("Task not found: id=%d", task_id)
         return None
@@ -264,7 +445,7 @@ class TaskManager:
             task.due_date = due_date
 
         task.updated_at = datetime.now().isoformat()
-        self._save_tasks()
+        self._persist()
 
         logger.info("Task updated: id=%d", task_id)
         return True
@@ -283,8 +464,8 @@ class TaskManager:
             logger.error("Cannot delete task %d: task not found", task_id)
             return False
 
-        self.tasks.remove(task)
-        self._save_tasks()
+        del self._by_id[task_id]
+        self._persist()
 
         logger.info("Task deleted: id=%d, title='%s'", task_id, task.title)
         return True
@@ -301,16 +482,23 @@ class TaskManager:
         Returns:
             List of tasks matching the filters
         """
-        filtered_tasks = self.tasks
-
-        if status:
-            filtered_tasks = [t for t in filtered_tasks if t.status == status]
-            logger.debug("Filtered by status '%s': %d tasks", status, len(filtered_tasks))
-
-        if priority:
-            filtered_tasks = [t for t in filtered_tasks if t.priority == priority]
-            logger.debug("Filtered by priority '%s': %d tasks", priority, len(filtered_tasks))
+        if status and priority:
+            filtered_tasks = [
+                t for t in self._by_id.values() if t.status == status and t.priority == priority
+            ]
+        elif status:
+            filtered_tasks = [t for t in self._by_id.values() if t.status == status]
+        elif priority:
+            filtered_tasks = [t for t in self._by_id.values() if t.priority == priority]
+        else:
+            return self.tasks
 
+        logger.debug(
+            "Filtered by status '%s', priority '%s': %d tasks",
+            status,
+            priority,
+            len(filtered_tasks),
+        )
         return filtered_tasks
 
     def get_overdue_tasks(self) -> List[Task]:
@@ -319,7 +507,8 @@ class TaskManager:
         Returns:
             List of overdue tasks
         """
-        overdue = [task for task in self.tasks if task.is_overdue()]
+        now = datetime.now()
+        overdue = [task for task in self._by_id.values() if task.is_overdue_at(now)]
         if overdue:
             logger.warning("Found %d overdue tasks", len(overdue))
         else:
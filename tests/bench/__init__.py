@@ -0,0 +1 @@
+"""Benchmarks for the task_manager package (run with --benchmark-only)."""
@@ -0,0 +1,8 @@
+"""Sizes and value sets shared by the benchmark fixtures and tests."""
+
+from src.task_manager import TaskPriority, TaskStatus
+
+BENCH_SIZE = 10_000
+
+PRIORITIES = (TaskPriority.LOW, TaskPriority.MEDIUM, TaskPriority.HIGH, TaskPriority.CRITICAL)
+STATUSES = (TaskStatus.TODO, TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED, TaskStatus.CANCELLED)
@@ -0,0 +1,32 @@
+"""Shared fixtures for the TaskManager benchmarks."""
+
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from src.task_manager import TaskManager
+from tests.bench._data import BENCH_SIZE, PRIORITIES, STATUSES
+
+
+@pytest.fixture(scope="session")
+def large_manager(tmp_path_factory):
+    """Load a TaskManager holding BENCH_SIZE tasks spread over every priority and status.
+
+    Due dates run from 15 days in the past to 14 days ahead, so about half of
+    the open tasks are overdue.
+    """
+    today = date.today()
+    records = [
+        {
+            "task_id": i,
+            "title": f"Task {i}",
+            "priority": PRIORITIES[i % len(PRIORITIES)],
+            "status": STATUSES[(i // len(PRIORITIES)) % len(STATUSES)],
+            "due_date": (today + timedelta(days=i % 30 - 15)).isoformat(),
+        }
+        for i in range(1, BENCH_SIZE + 1)
+    ]
+    path = tmp_path_factory.mktemp("bench") / "tasks.json"
+    path.write_text(json.dumps({"next_id": BENCH_SIZE + 1, "tasks": records}), encoding="utf-8")
+    return TaskManager(storage_path=str(path))
@@ -0,0 +1,13 @@
+"""Benchmarks for TaskManager.get_task."""
+
+import pytest
+
+from tests.bench._data import BENCH_SIZE
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_get_task_last(benchmark, large_manager):
+    """Benchmark looking up the most recently added of BENCH_SIZE tasks."""
+    task = benchmark(large_manager.get_task, BENCH_SIZE)
+    assert task.task_id == BENCH_SIZE
@@ -0,0 +1,23 @@
+"""Benchmarks for TaskManager.list_tasks."""
+
+import pytest
+
+from src.task_manager import TaskPriority, TaskStatus
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize(
+    "filter_kwargs",
+    [
+        {},
+        {"status": TaskStatus.TODO},
+        {"priority": TaskPriority.HIGH},
+        {"status": TaskStatus.TODO, "priority": TaskPriority.HIGH},
+    ],
+    ids=["no_filter", "status", "priority", "status_and_priority"],
+)
+def test_list_tasks_filter(benchmark, large_manager, filter_kwargs):
+    """Benchmark listing BENCH_SIZE tasks with and without filters."""
+    tasks = benchmark(large_manager.list_tasks, **filter_kwargs)
+    assert tasks
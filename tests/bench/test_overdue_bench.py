@@ -0,0 +1,11 @@
+"""Benchmarks for TaskManager.get_overdue_tasks."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_get_overdue_tasks(benchmark, large_manager):
+    """Benchmark scanning BENCH_SIZE tasks for overdue ones."""
+    overdue = benchmark(large_manager.get_overdue_tasks)
+    assert overdue
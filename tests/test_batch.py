@@ -0,0 +1,91 @@
+"""Tests for the batch CLI command."""
+
+import pytest
+from click.testing import CliRunner
+
+from src.cli import cli
+from src.task_manager import TaskManager
+
+
+@pytest.fixture
+def run_batch(tmp_path, monkeypatch):
+    """Return a function that runs a batch script in an empty working directory."""
+    monkeypatch.chdir(tmp_path)
+
+    def run(script):
+        return CliRunner().invoke(cli, ["batch", "-"], input=script)
+
+    return run
+
+
+@pytest.fixture
+def save_calls(monkeypatch):
+    """Count calls to TaskManager._save_tasks."""
+    calls = []
+    original = TaskManager._save_tasks  # pylint: disable=protected-access
+
+    def counting_save(self):
+        calls.append(self)
+        original(self)
+
+    monkeypatch.setattr(TaskManager, "_save_tasks", counting_save)
+    return calls
+
+
+class TestBatch:
+    """Test cases for the batch command."""
+
+    def test_script_is_saved_once(self, run_batch, save_calls):
+        """Test that a multi-line script is applied and written in a single flush."""
+        result = run_batch('# setup\nadd "First" -p high\n\nadd Second\ncomplete 1\n')
+
+        assert result.exit_code == 0
+        assert "Batch finished: 3 applied." in result.output
+        assert len(save_calls) == 1
+        manager = TaskManager()
+        assert [t.title for t in manager.tasks] == ["First", "Second"]
+        assert manager.get_task(1).status == "completed"  # type: ignore[union-attr]
+
+    def test_unknown_command(self, run_batch):
+        """Test that an unknown command fails its line and the rest still runs."""
+        result = run_batch("frobnicate 1\nadd After\n")
+
+        assert result.exit_code == 1
+        assert "Line 1: Unknown command 'frobnicate'" in result.output
+        assert "Batch finished: 1 applied, 1 failed." in result.output
+        assert [t.title for t in TaskManager().tasks] == ["After"]
+
+    def test_line_exiting_with_error(self, run_batch):
+        """Test that a subcommand calling sys.exit(1) counts as a failed line."""
+        result = run_batch('add "   "\nadd Valid\n')
+
+        assert result.exit_code == 1
+        assert "Invalid input: Task title cannot be empty" in result.output
+        assert "Batch finished: 1 applied, 1 failed." in result.output
+
+    def test_aborted_delete(self, run_batch):
+        """Test that a delete without --yes is reported as aborted."""
+        result = run_batch("add Keep\ndelete 1\n")
+
+        assert result.exit_code == 1
+        assert "Line 2: aborted" in result.output
+        assert [t.title for t in TaskManager().tasks] == ["Keep"]
+
+    def test_help_line_does_not_stop_batch(self, run_batch):
+        """Test that --help prints usage and the script carries on."""
+        result = run_batch("add X1\nadd --help\nadd X2\n")
+
+        assert result.exit_code == 0
+        assert "Usage:" in result.output
+        assert "Batch finished: 3 applied." in result.output
+        assert [t.title for t in TaskManager().tasks] == ["X1", "X2"]
+
+    def test_corrupted_task_file(self, run_batch, tmp_path):
+        """Test that an unreadable task file is reported instead of raising."""
+        (tmp_path / "tasks.json").write_text("{invalid json content", encoding="utf-8")
+
+        result = run_batch("add Never\n")
+
+        assert result.exit_code == 1
+        assert "Failed to load tasks:" in result.output
+        assert result.exception is None or isinstance(result.exception, SystemExit)
@@ -98,6 +98,28 @@ class TestTask:
         assert task.created_at == "2025-01-01T12:00:00"
         assert task.updated_at == "2025-01-02T12:00:00"
 
+    def test_task_from_dict_minimal(self):
+        """Test that missing optional fields get their defaults."""
+        task = Task.from_dict({"title": "Minimal"})
+
+        assert task.title == "Minimal"
+        assert task.description == ""
+        assert task.priority == TaskPriority.MEDIUM
+        assert task.status == TaskStatus.TODO
+        assert task.due_date is None
+        assert task.task_id is None
+        assert task.created_at is not None
+        assert task.updated_at == task.created_at
+        assert task.is_overdue() is False
+
+    def test_task_uses_slots(self):
+        """Test that tasks have no per-instance __dict__."""
+        task = Task(title="Slotted")
+
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            setattr(task, "unknown_field", "value")
+
     def test_is_overdue_no_due_date(self):
         """Test that task without due date is not overdue."""
         task = Task(title="No Due Date")
@@ -115,6 +137,35 @@ class TestTask:
         task = Task(title="Overdue Task", due_date=past_date, status=TaskStatus.TODO)
         assert task.is_overdue() is True
 
+    def test_is_overdue_date_only(self):
+        """Test overdue detection for plain YYYY-MM-DD due dates."""
+        yesterday = (datetime.now() - timedelta(days=1)).date().isoformat()
+        tomorrow = (datetime.now() + timedelta(days=1)).date().isoformat()
+
+        assert Task(title="Past", due_date=yesterday).is_overdue() is True
+        assert Task(title="Future", due_date=tomorrow).is_overdue() is False
+
+    def test_is_overdue_at(self):
+        """Test checking overdue status against a supplied time."""
+        now = datetime(2025, 6, 15, 12, 0)
+        date_only = Task(title="Date only", due_date="2025-06-15")
+        with_time = Task(title="With time", due_date="2025-06-15T18:00:00")
+
+        assert date_only.is_overdue_at(now) is True
+        assert date_only.is_overdue_at(now - timedelta(days=1)) is False
+        assert with_time.is_overdue_at(now) is False
+        assert with_time.is_overdue_at(now + timedelta(hours=7)) is True
+
+    def test_due_date_assignment_clears_cached_parse(self):
+        """Test that assigning due_date directly is reflected by is_overdue."""
+        now = datetime(2025, 6, 15, 12, 0)
+        task = Task(title="Moved", due_date="2025-06-14T09:00:00")
+        assert task.is_overdue_at(now) is True
+
+        task.due_date = "2025-06-16T09:00:00"
+
+        assert task.is_overdue_at(now) is False
+
     def test_is_overdue_completed_task(self):
         """Test that completed task is not considered overdue even if past due date."""
         past_date = (datetime.now() - timedelta(days=7)).isoformat()
@@ -129,3 +180,14 @@ class TestTask:
         """Test that invalid date format returns False."""
         task = Task(title="Invalid Date", due_date="not-a-date")
         assert task.is_overdue() is False
+
+    @pytest.mark.parametrize("suffix", ["Z", "+00:00"])
+    def test_is_overdue_timezone_aware_date(self, suffix):
+        """Test that a timezone-aware due date is logged and returns False, not raised."""
+        task = Task(title="Aware", due_date=f"2024-01-10T00:00:00{suffix}")
+        assert task.is_overdue() is False
+
+    def test_is_overdue_invalid_calendar_date(self):
+        """Test that a YYYY-MM-DD shaped but impossible date returns False."""
+        task = Task(title="Invalid Date", due_date="2024-13-45")
+        assert task.is_overdue() is False
@@ -1,5 +1,6 @@
 """Unit tests for the TaskManager class."""
 
+import copy
 import json
 from datetime import datetime, timedelta
 
@@ -8,25 +9,93 @@ import pytest
 from src.task_manager import TaskManager, TaskPriority, TaskStatus
 
 
+@pytest.fixture(scope="session")
+def storage_dir(tmp_path_factory, request):
+    """Create one temporary directory shared by every test's storage file.
+
+    Under pytest-xdist each worker gets its own directory, named after the
+    worker id ("master" when running serially).
+    """
+    worker_id = getattr(request.config, "workerinput", {}).get("workerid", "master")
+    return tmp_path_factory.mktemp(f"tm_{worker_id}")
+
+
+@pytest.fixture(scope="session")
+def iso_dates():
+    """Return ISO timestamps a week in the past and future, computed once per session."""
+    now = datetime.now()
+    return {
+        "past": (now - timedelta(days=7)).isoformat(),
+        "future": (now + timedelta(days=7)).isoformat(),
+    }
+
+
 @pytest.fixture
-def temp_storage(tmp_path):
-    """Create a temporary storage file for testing."""
-    return tmp_path / "test_tasks.json"
+def temp_storage(storage_dir, request):  # pylint: disable=redefined-outer-name
+    """Return a storage file path unique to the current test."""
+    return storage_dir / f"{request.node.name}.json"
+
+
+@pytest.fixture(scope="session")
+def empty_manager_template(storage_dir):  # pylint: disable=redefined-outer-name
+    """Build one empty TaskManager for task_manager to copy."""
+    return TaskManager(storage_path=str(storage_dir / "template.json"))
+
+
+@pytest.fixture
+def task_manager(empty_manager_template, monkeypatch):  # pylint: disable=redefined-outer-name
+    """Create a TaskManager that keeps its tasks in memory only.
+
+    Each test gets a deep copy of the session template instead of running
+    __init__ again. Saving is patched out since these tests only check
+    in-memory behaviour; the persistence tests below build managers on
+    temp_storage directly.
+    """
+    manager = copy.deepcopy(empty_manager_template)
+    monkeypatch.setattr(manager, "_save_tasks", lambda: None)
+    return manager
 
 
 @pytest.fixture
-def task_manager(temp_storage):  # pylint: disable=redefined-outer-name
-    """Create a TaskManager instance with temporary storage."""
-    return TaskManager(storage_path=str(temp_storage))
+def task_manager_batch(temp_storage):  # pylint: disable=redefined-outer-name
+    """Create a TaskManager that buffers its writes and saves once at teardown."""
+    manager = TaskManager(storage_path=str(temp_storage), autosave=False)
+    yield manager
+    manager.flush()
+
+
+@pytest.fixture(scope="session")
+def corrupted_storage(storage_dir):  # pylint: disable=redefined-outer-name
+    """Write one storage file holding invalid JSON, shared by the whole session."""
+    path = storage_dir / "corrupted.json"
+    path.write_text("{invalid json content", encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="module")
+def readonly_task_manager(storage_dir):  # pylint: disable=redefined-outer-name
+    """Create one empty TaskManager for tests that never mutate it."""
+    return TaskManager(storage_path=str(storage_dir / "readonly.json"))
+
+
+@pytest.fixture(scope="module")
+def populated_manager(storage_dir):  # pylint: disable=redefined-outer-name
+    """Create one TaskManager holding a mix of priorities and statuses for list tests."""
+    manager = TaskManager(storage_path=str(storage_dir / "populated.json"))
+    manager.add_task(title="Match", priority=TaskPriority.HIGH)
+    done = manager.add_task(title="High Done", priority=TaskPriority.HIGH)
+    manager.update_task(done.task_id, status=TaskStatus.COMPLETED)
+    manager.add_task(title="Low Todo", priority=TaskPriority.LOW)
+    return manager
 
 
 class TestTaskManager:  # pylint: disable=too-many-public-methods
     """Test cases for the TaskManager class."""
 
-    def test_init_creates_empty_task_list(self, task_manager):
+    def test_init_creates_empty_task_list(self, readonly_task_manager):
         """Test that new TaskManager starts with empty task list."""
-        assert len(task_manager.tasks) == 0
-        assert task_manager.next_id == 1
+        assert len(readonly_task_manager.tasks) == 0
+        assert readonly_task_manager.next_id == 1
 
     def test_add_task_basic(self, task_manager):
         """Test adding a basic task."""
@@ -51,16 +120,16 @@ class TestTaskManager:  # pylint: disable=too-many-public-methods
         assert task.priority == TaskPriority.HIGH
         assert task.due_date == "2025-12-31"
 
-    def test_add_multiple_tasks_increments_id(self, task_manager):
+    def test_add_multiple_tasks_increments_id(self, task_manager_batch):
         """Test that adding multiple tasks increments IDs correctly."""
-        task1 = task_manager.add_task(title="Task 1")
-        task2 = task_manager.add_task(title="Task 2")
-        task3 = task_manager.add_task(title="Task 3")
+        task1 = task_manager_batch.add_task(title="Task 1")
+        task2 = task_manager_batch.add_task(title="Task 2")
+        task3 = task_manager_batch.add_task(title="Task 3")
 
         assert task1.task_id == 1
         assert task2.task_id == 2
         assert task3.task_id == 3
-        assert len(task_manager.tasks) == 3
+        assert len(task_manager_batch.tasks) == 3
 
     def test_get_task_existing(self, task_manager):
         """Test getting an existing task."""
@@ -71,9 +140,9 @@ class TestTaskManager:  # pylint: disable=too-many-public-methods
         assert found_task.task_id == added_task.task_id
         assert found_task.title == "Find Me"
 
-    def test_get_task_non_existing(self, task_manager):
+    def test_get_task_non_existing(self, readonly_task_manager):
         """Test getting a non-existing task returns None."""
-        task = task_manager.get_task(999)
+        task = readonly_task_manager.get_task(999)
         assert task is None
 
     def test_update_task_title(self, task_manager):
@@ -112,9 +181,18 @@ class TestTaskManager:  # pylint: disable=too-many-public-methods
         assert updated_task.status == TaskStatus.IN_PROGRESS
         assert updated_task.description == "New description"
 
-    def test_update_task_non_existing(self, task_manager):
+    def test_update_task_due_date_rechecks_overdue(self, task_manager, iso_dates):
+        """Test that changing the due date is reflected by is_overdue."""
+        task = task_manager.add_task(title="Task", due_date=iso_dates["past"])
+        assert task.is_overdue() is True
+
+        task_manager.update_task(task.task_id, due_date=iso_dates["future"])
+
+        assert task.is_overdue() is False
+
+    def test_update_task_non_existing(self, readonly_task_manager):
         """Test updating a non-existing task returns False."""
-        success = task_manager.update_task(999, title="Should Fail")
+        success = readonly_task_manager.update_task(999, title="Should Fail")
         assert success is False
 
     def test_delete_task_existing(self, task_manager):
@@ -128,134 +206,164 @@ class TestTaskManager:  # pylint: disable=too-many-public-methods
         assert len(task_manager.tasks) == initial_count - 1
         assert task_manager.get_task(task.task_id) is None
 
-    def test_delete_task_non_existing(self, task_manager):
-        """Test deleting a non-existing task returns False."""
-        success = task_manager.delete_task(999)
-        assert success is False
-
-    def test_list_tasks_no_filter(self, task_manager):
-        """Test listing all tasks without filters."""
-        task_manager.add_task(title="Task 1", priority=TaskPriority.LOW)
-        task_manager.add_task(title="Task 2", priority=TaskPriority.HIGH)
-        task3 = task_manager.add_task(title="Task 3")
-        task_manager.update_task(task3.task_id, status=TaskStatus.COMPLETED)
-
-        tasks = task_manager.list_tasks()
-        assert len(tasks) == 3
-
-    def test_list_tasks_filter_by_status(self, task_manager):
-        """Test listing tasks filtered by status."""
-        task_manager.add_task(title="Todo 1")
-        task_manager.add_task(title="Todo 2")
-        task3 = task_manager.add_task(title="Done")
-        task_manager.update_task(task3.task_id, status=TaskStatus.COMPLETED)
-
-        todo_tasks = task_manager.list_tasks(status=TaskStatus.TODO)
-        assert len(todo_tasks) == 2
-        assert all(t.status == TaskStatus.TODO for t in todo_tasks)
-
-    def test_list_tasks_filter_by_priority(self, task_manager):
-        """Test listing tasks filtered by priority."""
-        task_manager.add_task(title="High 1", priority=TaskPriority.HIGH)
-        task_manager.add_task(title="High 2", priority=TaskPriority.HIGH)
-        task_manager.add_task(title="Low", priority=TaskPriority.LOW)
-
-        high_tasks = task_manager.list_tasks(priority=TaskPriority.HIGH)
-        assert len(high_tasks) == 2
-        assert all(t.priority == TaskPriority.HIGH for t in high_tasks)
-
-    def test_list_tasks_filter_by_status_and_priority(self, task_manager):
-        """Test listing tasks filtered by both status and priority."""
-        task_manager.add_task(
-            title="Match",
-            priority=TaskPriority.HIGH,
-        )
-        task2 = task_manager.add_task(
-            title="No Match - Status",
-            priority=TaskPriority.HIGH,
-        )
-        task_manager.update_task(task2.task_id, status=TaskStatus.COMPLETED)
-        task_manager.add_task(
-            title="No Match - Priority",
-            priority=TaskPriority.LOW,
-        )
+    def test_delete_task_keeps_order(self, task_manager_batch):
+        """Test that remaining tasks keep their insertion order after a delete."""
+        for title in ("First", "Second", "Third"):
+            task_manager_batch.add_task(title=title)
 
-        filtered = task_manager.list_tasks(
-            status=TaskStatus.TODO,
-            priority=TaskPriority.HIGH,
-        )
-        assert len(filtered) == 1
-        assert filtered[0].title == "Match"
+        task_manager_batch.delete_task(2)
 
-    def test_get_overdue_tasks_none(self, task_manager):
-        """Test getting overdue tasks when there are none."""
-        future_date = (datetime.now() + timedelta(days=7)).isoformat()
-        task_manager.add_task(title="Future Task", due_date=future_date)
+        assert [t.title for t in task_manager_batch.tasks] == ["First", "Third"]
+        assert [t.title for t in task_manager_batch.list_tasks()] == ["First", "Third"]
 
-        overdue = task_manager.get_overdue_tasks()
-        assert len(overdue) == 0
+    def test_delete_task_non_existing(self, readonly_task_manager):
+        """Test deleting a non-existing task returns False."""
+        success = readonly_task_manager.delete_task(999)
+        assert success is False
 
-    def test_get_overdue_tasks_some(self, task_manager):
+    @pytest.mark.parametrize(
+        "filter_kwargs,expected_titles",
+        [
+            ({}, {"Match", "High Done", "Low Todo"}),
+            ({"status": TaskStatus.TODO}, {"Match", "Low Todo"}),
+            ({"priority": TaskPriority.HIGH}, {"Match", "High Done"}),
+            ({"status": TaskStatus.TODO, "priority": TaskPriority.HIGH}, {"Match"}),
+        ],
+        ids=["no_filter", "status", "priority", "status_and_priority"],
+    )
+    def test_list_tasks(self, populated_manager, filter_kwargs, expected_titles):
+        """Test listing tasks with and without status/priority filters."""
+        tasks = populated_manager.list_tasks(**filter_kwargs)
+        assert {t.title for t in tasks} == expected_titles
+
+    @pytest.mark.parametrize(
+        "due_keys,expected_overdue",
+        [(["future"], 0), (["past", "past", "future"], 2)],
+        ids=["none", "some"],
+    )
+    def test_get_overdue_tasks(self, task_manager, iso_dates, due_keys, expected_overdue):
         """Test getting overdue tasks."""
-        past_date = (datetime.now() - timedelta(days=7)).isoformat()
-        future_date = (datetime.now() + timedelta(days=7)).isoformat()
-
-        task_manager.add_task(title="Overdue 1", due_date=past_date)
-        task_manager.add_task(title="Overdue 2", due_date=past_date)
-        task_manager.add_task(title="Future", due_date=future_date)
+        for i, key in enumerate(due_keys):
+            task_manager.add_task(title=f"Task {i}", due_date=iso_dates[key])
 
         overdue = task_manager.get_overdue_tasks()
-        assert len(overdue) == 2
-
-    def test_persistence_save_and_load(self, temp_storage):
-        """Test that tasks are persisted and loaded correctly."""
-        # Create manager and add tasks
+        assert len(overdue) == expected_overdue
+
+    @pytest.mark.parametrize(
+        "mutate,observe,expected",
+        [
+            (
+                lambda m, tid: m.add_task(title="Second", description="With description"),
+                lambda m, tid: (m.next_id, [(t.title, t.priority, t.description) for t in m.tasks]),
+                (
+                    3,
+                    [
+                        ("Original", TaskPriority.HIGH, ""),
+                        ("Second", TaskPriority.MEDIUM, "With description"),
+                    ],
+                ),
+            ),
+            (
+                lambda m, tid: m.update_task(tid, title="Updated"),
+                lambda m, tid: m.get_task(tid).title,
+                "Updated",
+            ),
+            (
+                lambda m, tid: m.delete_task(tid),
+                lambda m, tid: (m.get_task(tid), m.tasks),
+                (None, []),
+            ),
+        ],
+        ids=["add", "update", "delete"],
+    )
+    def test_persistence_round_trip(self, temp_storage, mutate, observe, expected):
+        """Test that adds, updates and deletes are persisted and loaded correctly."""
         manager1 = TaskManager(storage_path=str(temp_storage))
-        manager1.add_task(title="Persist Task 1", priority=TaskPriority.HIGH)
-        manager1.add_task(title="Persist Task 2", description="With description")
+        task = manager1.add_task(title="Original", priority=TaskPriority.HIGH)
+        mutate(manager1, task.task_id)
 
         # Create new manager with same storage
         manager2 = TaskManager(storage_path=str(temp_storage))
 
-        # Verify tasks were loaded
-        assert len(manager2.tasks) == 2
-        assert manager2.tasks[0].title == "Persist Task 1"
-        assert manager2.tasks[0].priority == TaskPriority.HIGH
-        assert manager2.tasks[1].title == "Persist Task 2"
-        assert manager2.tasks[1].description == "With description"
-        assert manager2.next_id == 3
+        assert observe(manager2, task.task_id) == expected
 
-    def test_persistence_update_reflected(
-        self, temp_storage
-    ):  # pylint: disable=redefined-outer-name
-        """Test that updates are persisted."""
-        manager1 = TaskManager(storage_path=str(temp_storage))
-        task = manager1.add_task(title="Original")
-        manager1.update_task(task.task_id, title="Updated")  # type: ignore[arg-type]
+    def test_deferred_save_written_on_flush(self, temp_storage):
+        """Test that autosave=False buffers changes until flush()."""
+        manager1 = TaskManager(storage_path=str(temp_storage), autosave=False)
+        manager1.add_task(title="Buffered 1")
+        manager1.add_task(title="Buffered 2")
+
+        assert not temp_storage.exists()
 
+        manager1.flush()
         manager2 = TaskManager(storage_path=str(temp_storage))
-        loaded_task = manager2.get_task(task.task_id)  # type: ignore[arg-type]
 
-        assert loaded_task.title == "Updated"  # type: ignore[union-attr]
+        assert [t.title for t in manager2.tasks] == ["Buffered 1", "Buffered 2"]
+        assert manager2.next_id == 3
 
-    def test_persistence_delete_reflected(
-        self, temp_storage
-    ):  # pylint: disable=redefined-outer-name
-        """Test that deletions are persisted."""
-        manager1 = TaskManager(storage_path=str(temp_storage))
-        task = manager1.add_task(title="To Delete")
-        manager1.delete_task(task.task_id)  # type: ignore[arg-type]
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_storage_format(self, temp_storage, pretty):
+        """Test that storage is compact by default and indented when pretty."""
+        manager1 = TaskManager(storage_path=str(temp_storage), pretty=pretty)
+        manager1.add_task(title="Tâche", description="ünïcode")
+
+        raw = temp_storage.read_text(encoding="utf-8")
+        assert ("\n  " in raw) is pretty
+        assert "Tâche" in raw
 
         manager2 = TaskManager(storage_path=str(temp_storage))
+        assert manager2.tasks[0].description == "ünïcode"
+
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_load_legacy_layout(self, temp_storage, monkeypatch, streaming):
+        """Test loading an indented file that stores next_id after the tasks."""
+        if streaming:
+            pytest.importorskip("ijson")
+            monkeypatch.setattr("src.task_manager.STREAM_MIN_BYTES", 0)
+        else:
+            monkeypatch.setattr("src.task_manager.ijson", None)
+        data = {
+            "tasks": [{"task_id": 4, "title": "Legacy", "priority": TaskPriority.LOW}],
+            "next_id": 7,
+        }
+        temp_storage.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+        manager = TaskManager(storage_path=str(temp_storage))
+
+        assert manager.next_id == 7
+        assert manager.get_task(4).title == "Legacy"  # type: ignore[union-attr]
+
+    def test_load_missing_and_duplicate_ids(self, temp_storage):
+        """Test that tasks sharing an id or lacking one all load with fresh ids."""
+        data = {
+            "next_id": 2,
+            "tasks": [
+                {"task_id": 1, "title": "A"},
+                {"task_id": 1, "title": "B"},
+                {"title": "C"},
+                {"task_id": None, "title": "D"},
+            ],
+        }
+        temp_storage.write_text(json.dumps(data), encoding="utf-8")
 
-        assert len(manager2.tasks) == 0
-        assert manager2.get_task(task.task_id) is None  # type: ignore[arg-type]
+        manager1 = TaskManager(storage_path=str(temp_storage))
+        assert [(t.task_id, t.title) for t in manager1.tasks] == [
+            (1, "A"),
+            (2, "B"),
+            (3, "C"),
+            (4, "D"),
+        ]
+        assert manager1.next_id == 5
+
+        manager1.add_task(title="E")
+        manager2 = TaskManager(storage_path=str(temp_storage))
+        assert [t.title for t in manager2.tasks] == ["A", "B", "C", "D", "E"]
 
-    def test_corrupted_json_raises_error(self, temp_storage):
+    @pytest.mark.parametrize("streaming", [False, True])
+    def test_corrupted_json_raises_error(self, corrupted_storage, monkeypatch, streaming):
         """Test that corrupted JSON file raises appropriate error."""
-        # Write invalid JSON
-        with open(temp_storage, "w", encoding="utf-8") as f:
-            f.write("{invalid json content")
-
+        if streaming:
+            pytest.importorskip("ijson")
+            monkeypatch.setattr("src.task_manager.STREAM_MIN_BYTES", 0)
         with pytest.raises(json.JSONDecodeError):
-            TaskManager(storage_path=str(temp_storage))
+            TaskManager(storage_path=str(corrupted_storage))